@@ -5,19 +5,23 @@ Author: Michal Fecko, 2025 (feckom@gmail.com)
 https://github.com/feckom/uot.git
 """
 import sys
-import argparse
-import argostranslate.package
-import argostranslate.translate
+import atexit
 import os
+import re
 import time
-import psutil
-import requests
-import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
 from textwrap import fill
+from types import SimpleNamespace
 from functools import lru_cache
 from pathlib import Path
-from typing import Set, List, Dict, Tuple, Optional, Any, Union
+from typing import Set, FrozenSet, List, Dict, Tuple, Optional, Any, Union, Iterator
+
+def _env_int(name: str, default: int, minimum: int = 1) -> int:
+    """Read a positive integer from the environment, falling back to default on bad values."""
+    try:
+        return max(minimum, int(os.getenv(name, default)))
+    except ValueError:
+        return default
 
 # Constants
 VERSION = "1.17"
@@ -25,29 +29,45 @@ AUTHOR = "Michal Fecko, 2025 (feckom@gmail.com), https://github.com/uot.git"
 MODELS_DIR = os.getenv("UOT_MODELS_DIR", "models")
 BASE_URL = "https://data.argosopentech.com/argospm/v1/"
 INDEX_URL = "https://raw.githubusercontent.com/argosopentech/argospm-index/main/index.json"
-MAX_DOWNLOAD_THREADS = 3
+MAX_DOWNLOAD_THREADS = _env_int("UOT_DL_WORKERS", 8)
+MAX_TRANSLATE_THREADS = min(4, os.cpu_count() or 1)
 DOWNLOAD_RETRY_DELAY = 2
 DOWNLOAD_TIMEOUT = 20
+DOWNLOAD_BLOCK_SIZE = 4 * 1024 * 1024  # 4MB
+PROGRESS_INTERVAL = 0.25  # seconds between progress bar redraws
 MODEL_INSTALL_TIMEOUT = 300
+DAEMON_RECV_SIZE = 64 * 1024
+DAEMON_REQUEST_TIMEOUT = 10  # seconds a client gets to send its whole request
+DAEMON_MAX_REQUEST_SIZE = 16 * 1024 * 1024
+
+# Model file names look like "translate-en_sk-1_9.argosmodel"; language codes
+# may contain dashes (e.g. "zh-TW"), the version is everything after the last dash
+MODEL_FILENAME_RE = re.compile(r"^translate-([^_]+)_([^_]+)-[^-]+\.argosmodel$")
 
 # Global state
-LANGUAGE_CACHE = {}  # Cache for language objects
+_VLOG_BUF: Optional[List[str]] = None  # Queued verbose messages while a batch is open
+_DIR_CACHE: Optional[Tuple[int, List[Tuple[str, str]]]] = None  # (models dir mtime_ns, [(name, path)])
+_PAIRS_CACHE: Optional[Tuple[int, FrozenSet[Tuple[str, str]]]] = None  # (models dir mtime_ns, language pairs)
 
 class TranslatorError(Exception):
     """Custom exception for translator errors"""
     pass
 
-def print_help(available_language_pairs: Set[Tuple[str, str]]) -> None:
-    """Print help text with available languages."""
-    installed_languages = get_installed_languages()
-    installed_codes = {lang.code for lang in installed_languages}
-
-    # Filter to only show installed and available pairs
-    valid_pairs = {(il, ol) for il, ol in available_language_pairs if il in installed_codes and ol in installed_codes}
+def print_help(available_language_pairs: Set[Tuple[str, str]], installed_only: bool = True) -> None:
+    """
+    Print help text with available languages.
+    With installed_only=False the pairs are shown as given, without asking
+    argostranslate which languages are installed (keeps -h free of its import).
+    """
+    if installed_only:
+        available_language_pairs = filter_installed_pairs(available_language_pairs)
 
-    # Extract unique input and output languages from valid pairs
-    input_languages = {il for il, ol in valid_pairs}
-    output_languages = {ol for il, ol in valid_pairs}
+    # Collect input and output languages of the pairs in one pass
+    input_languages = set()
+    output_languages = set()
+    for il, ol in available_language_pairs:
+        input_languages.add(il)
+        output_languages.add(ol)
 
     il_str = format_languages(input_languages)
     ol_str = format_languages(output_languages)
@@ -70,11 +90,16 @@ Optional:
   -c     clean model cache
   -l     list available languages and exit
   -p     show available pairs of languages and exit
+  -d     [socket] run as a daemon keeping models loaded, serving on a Unix socket
+  -dc    [socket] translate through a running daemon
 Examples:
   uot.py -il en -ol sk Hello world
   uot.py -il sk -ol en Ahoj svet
 You can also use stdin:
   echo Hello world | uot.py -il en -ol sk -i
+Daemon mode:
+  uot.py -d /tmp/uot.sock
+  uot.py -dc /tmp/uot.sock -il en -ol sk Hello world
 
 Note:
   Only language pairs with available models are supported.
@@ -88,33 +113,46 @@ def print_version() -> None:
     print(f"Universal Offline Translator (UOT)\nVersion: {VERSION}\nAuthor: {AUTHOR}")
 
 def verbose_log(message: str, verbose: bool = False) -> None:
-    """Log message if verbose mode is enabled."""
+    """Log message if verbose mode is enabled, or queue it while a batch is open."""
     if verbose:
-        print(message, file=sys.stderr)
+        if _VLOG_BUF is not None:
+            _VLOG_BUF.append(message)
+        else:
+            print(message, file=sys.stderr)
+
+def start_verbose_batch() -> None:
+    """Queue verbose messages until flush_verbose_log() writes them in one go."""
+    global _VLOG_BUF
+    if _VLOG_BUF is None:
+        _VLOG_BUF = []
+
+def flush_verbose_log() -> None:
+    """Write queued verbose messages with a single stderr write and end the batch."""
+    global _VLOG_BUF
+    if _VLOG_BUF:
+        sys.stderr.write("\n".join(_VLOG_BUF) + "\n")
+        sys.stderr.flush()
+    _VLOG_BUF = None
+
+# Never lose queued verbose messages, whatever path the program exits through
+atexit.register(flush_verbose_log)
+
+def _language_prefix(lang: str) -> str:
+    """Return the base language of a code, e.g. 'zh' for 'zh-TW'."""
+    return lang.split('-', 1)[0]
 
 def format_languages(languages: Set[str]) -> str:
     """Format language list in a compact form."""
     if not languages:
         return "No languages available. Please install models."
     
-    valid_languages = sorted(languages)
-    if not valid_languages:
-        return "No valid languages found in models."
-        
-    # Group languages by prefix
-    grouped = {}
-    for lang in valid_languages:
-        prefix = lang.split('-')[0] if '-' in lang else lang
-        grouped.setdefault(prefix, []).append(lang)
-    
-    # Create compact representation
-    compact = []
-    for prefix, codes in grouped.items():
-        if len(codes) == 1:
-            compact.append(codes[0])
-        else:
-            compact.append(f"{prefix}-*")
+    # Group languages by prefix, collapsing regional variants into 'prefix-*'
+    grouped = defaultdict(list)
+    for lang in languages:
+        grouped[_language_prefix(lang)].append(lang)
     
+    # Only the compact entries need sorting, not every language code
+    compact = sorted(codes[0] if len(codes) == 1 else f"{prefix}-*" for prefix, codes in grouped.items())
     return fill(", ".join(compact), width=80)
 
 def format_language_pairs(language_pairs: Set[Tuple[str, str]]) -> str:
@@ -123,13 +161,13 @@ def format_language_pairs(language_pairs: Set[Tuple[str, str]]) -> str:
         return "No language pairs available. Please install models."
     
     # Group by input language
-    grouped = {}
+    grouped = defaultdict(list)
     for il, ol in language_pairs:
-        grouped.setdefault(il, []).append(ol)
+        grouped[il].append(ol)
     
     compact = []
-    for il, ols in grouped.items():
-        ols_str = ", ".join(sorted(ols))  # Ensure output languages are sorted
+    for il in sorted(grouped):
+        ols_str = ", ".join(sorted(grouped[il]))  # Ensure output languages are sorted
         compact.append(f"{il}→({ols_str})")  # Combination notation
     
     return fill(", ".join(compact), width=80)
@@ -137,53 +175,147 @@ def format_language_pairs(language_pairs: Set[Tuple[str, str]]) -> str:
 @lru_cache(maxsize=1)
 def get_installed_languages():
     """Get installed languages with caching."""
+    # Deferred import, argostranslate pulls in heavy ML dependencies
+    import argostranslate.translate
     return argostranslate.translate.get_installed_languages()
 
-def detect_available_languages() -> Set[Tuple[str, str]]:
+@lru_cache(maxsize=1)
+def get_installed_languages_map() -> Dict[str, Any]:
+    """Get installed languages keyed by language code."""
+    return {sys.intern(lang.code): lang for lang in get_installed_languages()}
+
+@lru_cache(maxsize=1)
+def get_session():
+    """Get a shared HTTP session so the index and model downloads reuse keep-alive connections."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Connection failures and transient server errors are retried by the adapter,
+    # download_file() only has to retry failures in the middle of a transfer
+    retry = Retry(total=3, backoff_factor=DOWNLOAD_RETRY_DELAY, status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=max(16, MAX_DOWNLOAD_THREADS), max_retries=retry))
+    session.headers["Accept-Encoding"] = "identity"  # .argosmodel archives are already compressed
+    return session
+
+def _language_pairs_cache_path(models_dir: str) -> Path:
+    """
+    Path of the language pairs cache for a models directory.
+    It lives in the user cache directory (~/.cache/uot/ or $XDG_CACHE_HOME/uot/),
+    one file per absolute models directory path.
+    """
+    import hashlib
+    cache_root = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    key = hashlib.sha256(models_dir.encode("utf-8", "surrogateescape")).hexdigest()[:16]
+    return Path(cache_root) / "uot" / f"langs-{key}.json"
+
+def _load_language_pairs_cache(cache_path: Path, models_dir: str, mtime_ns: int) -> Optional[Set[Tuple[str, str]]]:
+    """Return cached language pairs if the cache matches the models directory and its mtime."""
+    import json
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached["models_dir"] == models_dir and cached["mtime_ns"] == mtime_ns:
+            return {(sys.intern(src), sys.intern(tgt)) for src, tgt in cached["pairs"]}
+    except Exception:
+        # Missing or corrupt cache, fall back to a rescan
+        pass
+    return None
+
+def _save_language_pairs_cache(cache_path: Path, models_dir: str, mtime_ns: int, language_pairs: Set[Tuple[str, str]]) -> None:
+    """Atomically write the language pairs cache into the user cache directory."""
+    import json
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"models_dir": models_dir, "mtime_ns": mtime_ns, "pairs": sorted(language_pairs)}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # Unwritable home directory and the like, caching is best effort
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+def _scan_models_dir() -> List[Tuple[str, str]]:
+    """
+    List (name, path) of the .argosmodel files in the models directory.
+    The listing is kept for the rest of the process and only rescanned
+    when the directory modification time changes.
+    """
+    global _DIR_CACHE
+    mtime_ns = os.stat(MODELS_DIR).st_mtime_ns
+    if _DIR_CACHE is not None and _DIR_CACHE[0] == mtime_ns:
+        return _DIR_CACHE[1]
+
+    with os.scandir(MODELS_DIR) as entries:
+        model_files = [(entry.name, entry.path) for entry in entries if entry.name.endswith(".argosmodel") and entry.is_file()]
+    _DIR_CACHE = (mtime_ns, model_files)
+    return model_files
+
+def detect_available_languages() -> FrozenSet[Tuple[str, str]]:
     """
     Detect available language pairs from model files in the models directory.
     Each model file has a name like "translate-en_sk-1_9.argosmodel".
-    Returns a set of tuples (source_lang, target_lang).
+    Returns a frozenset of tuples (source_lang, target_lang).
+    The result is kept for the rest of the process and cached in the user
+    cache directory (so writing it never changes the models directory's own
+    mtime), both reused for as long as the directory modification time does
+    not change.
     """
+    global _PAIRS_CACHE
     models_dir = Path(MODELS_DIR)
-    if not models_dir.exists():
+    try:
+        dir_stat = models_dir.stat()
+    except FileNotFoundError:
         print(f"[ERROR] Models directory '{MODELS_DIR}' not found.", file=sys.stderr)
         sys.exit(1)
 
-    model_files = list(models_dir.glob("translate-*.argosmodel"))
+    if _PAIRS_CACHE is not None and _PAIRS_CACHE[0] == dir_stat.st_mtime_ns:
+        return _PAIRS_CACHE[1]
+
+    abs_models_dir = os.path.abspath(MODELS_DIR)
+    cache_path = _language_pairs_cache_path(abs_models_dir)
+    cached_pairs = _load_language_pairs_cache(cache_path, abs_models_dir, dir_stat.st_mtime_ns)
+    if cached_pairs is not None:
+        _PAIRS_CACHE = (dir_stat.st_mtime_ns, frozenset(cached_pairs))
+        return _PAIRS_CACHE[1]
+
+    model_files = [name for name, _ in _scan_models_dir()]
     if not model_files:
         print(f"[ERROR] No model files found in '{MODELS_DIR}'.", file=sys.stderr)
-        return set()
+        return frozenset()
 
     available_language_pairs: Set[Tuple[str, str]] = set()
 
     for model_file in model_files:
-        name = model_file.stem  # e.g. translate-en_sk-1_9
-        if name.startswith("translate-"):
-            try:
-                parts = name[len("translate-"):].split("-")
-                # Join everything except the version back together (in case language codes have dashes)
-                lang_part = "-".join(parts[:-1])
-                source_target = lang_part.split("_")
-                if len(source_target) == 2:
-                    tgt, src = source_target #Fixed language detection
-                    available_language_pairs.add((src, tgt)) #Fixed language detection
-            except Exception as e:
-                print(f"[WARNING] Could not parse language pair from '{name}': {e}", file=sys.stderr)
-
-    return available_language_pairs
+        match = MODEL_FILENAME_RE.match(model_file)  # e.g. translate-en_sk-1_9.argosmodel
+        if match:
+            tgt, src = match.groups() #Fixed language detection
+            # Interned so later set and dict lookups by language code compare by identity
+            available_language_pairs.add((sys.intern(src), sys.intern(tgt))) #Fixed language detection
+
+    _save_language_pairs_cache(cache_path, abs_models_dir, dir_stat.st_mtime_ns, available_language_pairs)
+    _PAIRS_CACHE = (dir_stat.st_mtime_ns, frozenset(available_language_pairs))
+    return _PAIRS_CACHE[1]
+
+def filter_installed_pairs(language_pairs: FrozenSet[Tuple[str, str]]) -> Set[Tuple[str, str]]:
+    """Keep only the pairs whose both languages are installed in argostranslate."""
+    installed_codes = get_installed_languages_map()
+    return {(il, ol) for il, ol in language_pairs if il in installed_codes and ol in installed_codes}
 
 def install_model(model_path: str, verbose: bool = False, timeout: int = MODEL_INSTALL_TIMEOUT) -> bool:
-    """Install a translation model."""
-    if not os.path.exists(model_path):
-        verbose_log(f"[WARNING] Model file '{model_path}' not found. Skipping.", verbose)
-        return False
-    
+    """Install a translation model. A missing file is reported like any other install failure."""
+    import argostranslate.package
     try:
         argostranslate.package.install_from_path(model_path)
         verbose_log(f"[INFO] Successfully installed model '{os.path.basename(model_path)}'", verbose)
-        # Reset the cache after installing new models
+        # Reset the caches after installing new models
         get_installed_languages.cache_clear()
+        get_installed_languages_map.cache_clear()
+        _find_translation_cached.cache_clear()
         return True
     except Exception as e:
         print(f"[ERROR] Failed to install model '{os.path.basename(model_path)}': {e}", file=sys.stderr)
@@ -191,29 +323,26 @@ def install_model(model_path: str, verbose: bool = False, timeout: int = MODEL_I
 
 def install_models_from_local_dir(verbose: bool = False) -> None:
     """Install all models from the local models directory."""
-    models_dir = Path(MODELS_DIR)
-    if not models_dir.exists():
+    try:
+        model_files = [path for _, path in _scan_models_dir()]
+    except FileNotFoundError:
         print(f"[ERROR] Models directory '{MODELS_DIR}' not found.", file=sys.stderr)
         sys.exit(1)
     
-    model_files = list(models_dir.glob("*.argosmodel"))
     if not model_files:
         print(f"[ERROR] No models found in '{MODELS_DIR}' to install.", file=sys.stderr)
         sys.exit(1)
     
     verbose_log(f"[INFO] Installing {len(model_files)} model(s)...", verbose)
     
-    with ThreadPoolExecutor() as executor:
-        futures = {executor.submit(install_model, str(model_path), verbose): model_path for model_path in model_files}
-        
-        installed = 0
-        for future in as_completed(futures):
-            model_path = futures[future]
-            try:
-                if future.result():
-                    installed += 1
-            except Exception as e:
-                print(f"[ERROR] Failed to install '{model_path.name}': {e}", file=sys.stderr)
+    # Installs all write into the same argostranslate packages directory, so run them serially
+    installed = 0
+    for model_path in model_files:
+        try:
+            if install_model(model_path, verbose):
+                installed += 1
+        except Exception as e:
+            print(f"[ERROR] Failed to install '{os.path.basename(model_path)}': {e}", file=sys.stderr)
     
     if installed == 0:
         print("[ERROR] Failed to install any models.", file=sys.stderr)
@@ -227,6 +356,7 @@ def ensure_models_dir() -> None:
 
 def clean_model_cache(verbose: bool = False) -> None:
     """Clean the model cache by uninstalling all installed packages."""
+    import argostranslate.package
     try:
         installed_packages = argostranslate.package.get_installed_packages()
         if not installed_packages:
@@ -238,44 +368,109 @@ def clean_model_cache(verbose: bool = False) -> None:
             verbose_log(f"[INFO] Uninstalled: {package}", verbose)
 
         get_installed_languages.cache_clear()
+        get_installed_languages_map.cache_clear()
+        _find_translation_cached.cache_clear()
         print("[INFO] All installed translation models have been uninstalled.")
     except Exception as e:
         print(f"[ERROR] Failed to clean cache: {e}", file=sys.stderr)
         sys.exit(1)
 
-def download_file(url: str, dest_path: str, verbose: bool = False, retries: int = 3) -> bool:
-    """Download a file with progress tracking and retries."""
+def download_file(url: str, dest_path: str, verbose: bool = False, retries: int = 3, expected_sha256: Optional[str] = None) -> bool:
+    """
+    Download a file with progress tracking and retries.
+
+    Data is written to '<dest_path>.part' and only renamed to dest_path once
+    the whole file has arrived, so an existing dest_path is always complete.
+    A '.part' file left behind by an interrupted run is resumed with a Range
+    request when the server supports it.
+    If expected_sha256 is given, the file is hashed while it is written and
+    a mismatch counts as a failed attempt.
+    """
+    import hashlib
+
+    tmp_path = dest_path + ".part"
+    # Redrawing a progress bar only makes sense on a terminal, not in pipes or log files
+    show_progress = sys.stdout.isatty()
     for attempt in range(retries):
         try:
-            with requests.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            try:
+                resume_from = os.path.getsize(tmp_path)
+            except OSError:
+                resume_from = 0
+            headers = {"Range": f"bytes={resume_from}-"} if resume_from else {}
+            
+            with get_session().get(url, stream=True, timeout=DOWNLOAD_TIMEOUT, headers=headers) as response:
                 if response.status_code == 404:
                     print(f"[ERROR] File not found (404): {url}")
                     return False
                 
+                if response.status_code == 416:
+                    # Stale partial file no longer matches the remote one, start over
+                    os.remove(tmp_path)
+                    raise IOError("Partial download does not match remote file")
+                
                 response.raise_for_status()
-                total_size = int(response.headers.get('content-length', 0))
-                block_size = 1024 * 1024  # 1MB
-                downloaded_size = 0
+                resuming = resume_from and response.status_code == 206
+                if resume_from and not resuming:
+                    verbose_log(f"[INFO] Server ignored resume request, restarting {os.path.basename(dest_path)}", verbose)
+                elif resuming:
+                    verbose_log(f"[INFO] Resuming {os.path.basename(dest_path)} from {resume_from} bytes", verbose)
+                
+                downloaded_size = resume_from if resuming else 0
+                content_length = int(response.headers.get('content-length', 0))
+                # Content-Length counts encoded bytes, which only match the file when the body is not encoded
+                encoded = response.headers.get('content-encoding', 'identity') != 'identity'
+                total_size = downloaded_size + content_length if content_length and not encoded else 0
+                block_size = DOWNLOAD_BLOCK_SIZE
+                last_print = 0.0
                 
-                with open(dest_path, 'wb') as file:
-                    for data in response.iter_content(block_size):
+                hasher = hashlib.sha256() if expected_sha256 else None
+                if hasher and resuming:
+                    # Seed the hash with the bytes already on disk
+                    with open(tmp_path, 'rb') as partial:
+                        for data in iter(lambda: partial.read(block_size), b''):
+                            hasher.update(data)
+                
+                # Read the raw stream directly, still undoing any transfer encoding a server applies anyway
+                response.raw.decode_content = True
+                with open(tmp_path, 'ab' if resuming else 'wb') as file:
+                    while True:
+                        data = response.raw.read(block_size)
+                        if not data:
+                            break
+                        if hasher:
+                            hasher.update(data)
                         file.write(data)
                         downloaded_size += len(data)
                         
-                        if total_size:
+                        # Throttle progress redraws to avoid print stalls on fast links
+                        if show_progress and total_size and (time.monotonic() - last_print >= PROGRESS_INTERVAL or downloaded_size == total_size):
+                            last_print = time.monotonic()
                             done = int(50 * downloaded_size / total_size)
                             progress = f"[{'#' * done}{'.' * (50 - done)}]"
                             mb_done = downloaded_size // (1024 * 1024)
                             mb_total = total_size // (1024 * 1024)
                             print(f"\rDownloading {os.path.basename(dest_path)} {progress} {mb_done}MB/{mb_total}MB", end='')
                 
-                print("\nDone.")
+                if total_size and downloaded_size != total_size:
+                    raise IOError(f"Incomplete download: got {downloaded_size} of {total_size} bytes")
+                
+                if hasher and hasher.hexdigest() != expected_sha256.lower():
+                    raise IOError(f"Checksum mismatch for {os.path.basename(dest_path)}")
+                
+                os.replace(tmp_path, dest_path)
+                if show_progress:
+                    print("\nDone.")
+                else:
+                    print(f"Downloaded {os.path.basename(dest_path)}.")
                 return True
                 
         except Exception as e:
             print(f"\n[ERROR] Attempt {attempt + 1} failed: {e}")
-            if os.path.exists(dest_path):
-                os.remove(dest_path)
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
             
             if attempt < retries - 1:
                 time.sleep(DOWNLOAD_RETRY_DELAY)
@@ -290,87 +485,135 @@ def normalize_version(version: str) -> str:
     """Normalize version string for filenames."""
     return version.replace('.', '_')
 
-def download_model(item: Dict[str, Any], verbose: bool = False) -> bool:
-    """Download a single model from the index."""
+def _process_index_item(item: Dict[str, Any], verbose: bool = False) -> Tuple[str, str]:
+    """
+    Download a single model from the index.
+
+    The entry must already be validated by the caller (it has "code" and
+    "package_version"). Returns a tuple (status, filename) where status is
+    one of "downloaded", "skip" or "failed".
+    """
+    filename = generate_filename(item["code"], item["package_version"])
     try:
-        if not all(k in item for k in ("code", "package_version")):
-            verbose_log(f"[SKIP] Entry missing required fields: {item}", verbose)
-            return False
-        
-        code = item["code"]
-        package_version = item["package_version"]
-        filename = generate_filename(code, package_version)
         file_url = f"{BASE_URL}{filename}"
         dest_path = os.path.join(MODELS_DIR, filename)
-        
+
         if os.path.exists(dest_path):
             print(f"[SKIP] {filename} already exists.")
-            return False
-        
-        return download_file(file_url, dest_path, verbose)
+            return "skip", filename
+
+        if download_file(file_url, dest_path, verbose, expected_sha256=item.get("sha256")):
+            return "downloaded", filename
+        return "failed", filename
     except Exception as e:
         print(f"[ERROR] Failed to download model: {e}", file=sys.stderr)
-        return False
+        return "failed", filename
+
+def _iter_index_items(response: Any) -> Iterator[Any]:
+    """Yield entries of the model index, streaming them with ijson when it is installed."""
+    try:
+        import ijson
+    except ImportError:
+        yield from response.json()
+        return
+    
+    response.raw.decode_content = True
+    try:
+        yield from ijson.items(response.raw, 'item')
+    except ijson.JSONError as e:
+        # Surface parse errors the same way response.json() does
+        raise ValueError(str(e)) from e
 
 def install_models_from_index(verbose: bool = False) -> None:
     """Install models from the Argos OpenTech index."""
+    from concurrent.futures import ThreadPoolExecutor
+    import requests
+    import urllib3
+
     ensure_models_dir()
     print(f"Fetching model index from {INDEX_URL}...")
     
     try:
-        response = requests.get(INDEX_URL, timeout=10)
+        response = get_session().get(INDEX_URL, timeout=10, stream=True)
         response.raise_for_status()
-        index_data = response.json()
     except requests.exceptions.RequestException as e:
         print(f"[ERROR] Failed to fetch index: {e}", file=sys.stderr)
         sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"[ERROR] Invalid JSON in index: {e}", file=sys.stderr)
-        sys.exit(1)
     
-    verbose_log(f"[DEBUG] Loaded JSON index successfully.", verbose)
+    # One directory listing instead of a stat per index entry
+    existing = {name for name, _ in _scan_models_dir()}
+    total_entries = 0
+    packages_found = 0
+    packages_skipped = 0
+    futures = []
     
-    valid_entries = [item for item in index_data if item and all(k in item for k in ("code", "package_version"))]
-    packages_found = len(valid_entries)
+    # Downloads are network-bound and independent, so overlap them across workers.
+    # Each entry is submitted as soon as it is parsed instead of after the whole index.
+    executor = ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_THREADS)
+    with response:
+        try:
+            for item in _iter_index_items(response):
+                total_entries += 1
+                try:
+                    if not item or not all(k in item for k in ("code", "package_version")):
+                        continue
+                    filename = generate_filename(item["code"], item["package_version"])
+                except (AttributeError, TypeError) as e:
+                    verbose_log(f"[SKIP] Malformed index entry {item!r}: {e}", verbose)
+                    continue
+                packages_found += 1
+                # Already downloaded models never reach the pool
+                if filename in existing:
+                    print(f"[SKIP] {filename} already exists.")
+                    packages_skipped += 1
+                    continue
+                futures.append(executor.submit(_process_index_item, item, verbose))
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, ValueError) as e:
+            # Drop queued downloads instead of waiting for them before exiting
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+            if isinstance(e, ValueError):
+                print(f"[ERROR] Invalid JSON in index: {e}", file=sys.stderr)
+            else:
+                print(f"[ERROR] Failed to fetch index: {e}", file=sys.stderr)
+            sys.exit(1)
     
+    verbose_log(f"[DEBUG] Loaded JSON index successfully.", verbose)
     print(f"Found {packages_found} packages in index.")
     
-    # Download and install packages using ThreadPoolExecutor
-    packages_downloaded = 0
+    with executor:
+        results = [future.result() for future in futures]
     
-    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_THREADS) as executor:
-        futures = {executor.submit(download_model, item, verbose): item for item in valid_entries}
-        
-        for future in as_completed(futures):
-            item = futures[future]
-            try:
-                if future.result():
-                    packages_downloaded += 1
-            except Exception as e:
-                print(f"[ERROR] Download failed: {e}", file=sys.stderr)
+    statuses = [status for status, _ in results]
+    packages_downloaded = statuses.count("downloaded")
+    packages_skipped += statuses.count("skip")
+    packages_failed = statuses.count("failed")
     
     print(f"\nFinished processing.\n")
-    print(f"Total entries in index: {len(index_data)}")
+    print(f"Total entries in index: {total_entries}")
     print(f"Valid packages found: {packages_found}")
     print(f"Packages downloaded: {packages_downloaded}")
-    print(f"Packages skipped (already exist): {packages_found - packages_downloaded}")
+    print(f"Packages skipped (already exist): {packages_skipped}")
+    if packages_failed:
+        print(f"Packages failed: {packages_failed}")
     
     if packages_downloaded > 0:
         print(f"\nInstalling downloaded models...")
         install_models_from_local_dir(verbose)
 
+@lru_cache(maxsize=1)
+def get_process():
+    """Get the psutil handle of the current process with caching."""
+    import psutil
+    return psutil.Process(os.getpid())
+
 def measure_memory_usage_mb() -> float:
     """Measure current memory usage in MB."""
-    process = psutil.Process(os.getpid())
-    mem_bytes = process.memory_info().rss
+    mem_bytes = get_process().memory_info().rss
     mem_mb = mem_bytes / (1024 * 1024)
     return round(mem_mb, 1)
 
-if not get_installed_languages():
-    verbose_log("[INFO] No installed languages found. Installing local models...", verbose=False) #Set default value False
-    install_models_from_local_dir(verbose=False) #Set default value False
-
-
 def validate_language_code(input_lang: str, output_lang: str, available_language_pairs: Set[Tuple[str, str]]) -> bool:
     """
     Validate that the language pair is available and installed.
@@ -384,8 +627,7 @@ def validate_language_code(input_lang: str, output_lang: str, available_language
         bool: True if the language pair is valid, False otherwise
     """
     # Check if languages are installed
-    installed_languages = get_installed_languages()
-    installed_codes = {lang.code for lang in installed_languages}
+    installed_codes = get_installed_languages_map()
     
     if input_lang not in installed_codes:
         print(f"[ERROR] Input language '{input_lang}' is not installed.", file=sys.stderr)
@@ -405,17 +647,16 @@ def validate_language_code(input_lang: str, output_lang: str, available_language
 
 def find_translation(from_code: str, to_code: str) -> Any:
     """Find a translation path between two languages."""
-    # Create a cache key for this language pair
-    cache_key = f"{from_code}_{to_code}"
-    
-    # Check if we have this translation in cache
-    if cache_key in LANGUAGE_CACHE:
-        return LANGUAGE_CACHE[cache_key]
-    
+    return _find_translation_cached(from_code, to_code)
+
+@lru_cache(maxsize=64)
+def _find_translation_cached(from_code: str, to_code: str) -> Any:
+    """Resolve a translation path, cached per language pair (failures are not cached)."""
     installed_languages = get_installed_languages()
+    installed_by_code = get_installed_languages_map()
     
-    from_lang = next((lang for lang in installed_languages if lang.code == from_code), None)
-    to_lang = next((lang for lang in installed_languages if lang.code == to_code), None)
+    from_lang = installed_by_code.get(from_code)
+    to_lang = installed_by_code.get(to_code)
     
     if not from_lang:
         # Limit the number of displayed codes to avoid overly long error messages
@@ -435,8 +676,6 @@ def find_translation(from_code: str, to_code: str) -> Any:
     if not translation:
         raise TranslatorError(f"No translation path from '{from_code}' to '{to_code}'.")
     
-    # Cache this translation for future use
-    LANGUAGE_CACHE[cache_key] = translation
     return translation
 
 def list_languages(available_language_pairs: Set[Tuple[str, str]], verbose: bool = False) -> None:
@@ -447,14 +686,15 @@ def list_languages(available_language_pairs: Set[Tuple[str, str]], verbose: bool
         available_language_pairs: Set of available language pairs
         verbose: Whether to show detailed info
     """
-    installed_languages = get_installed_languages()
-    installed_codes = {lang.code for lang in installed_languages}
+    installed_codes = get_installed_languages_map()
     
-    # Group by source language for better readability
+    # Group by source language for better readability, noting every listed code on the way
     source_to_targets = {}
+    listed_codes = set()
     for source, target in available_language_pairs:
         if source in installed_codes and target in installed_codes:
             source_to_targets.setdefault(source, set()).add(target)
+            listed_codes.update((source, target))
     
     if source_to_targets:
         print("Available language pairs (installed models):")
@@ -483,10 +723,9 @@ def list_languages(available_language_pairs: Set[Tuple[str, str]], verbose: bool
             'tl': 'Tagalog', 'tr': 'Turkish', 'uk': 'Ukrainian', 'zh': 'Chinese (Simplified)', 
             'zt': 'Chinese (Traditional)'
         }
-        for code in sorted(set(lang_code for pair in available_language_pairs for lang_code in pair)):
-            if code in installed_codes:
-                name = lang_names.get(code, f"Unknown ({code})")
-                print(f"  {code}: {name}")
+        for code in sorted(listed_codes):
+            name = lang_names.get(code, f"Unknown ({code})")
+            print(f"  {code}: {name}")
 
 def show_language_pairs(available_language_pairs: Set[Tuple[str, str]]) -> None:
     """
@@ -495,8 +734,7 @@ def show_language_pairs(available_language_pairs: Set[Tuple[str, str]]) -> None:
     Args:
         available_language_pairs: Set of available language pairs
     """
-    installed_languages = get_installed_languages()
-    installed_codes = {lang.code for lang in installed_languages}
+    installed_codes = get_installed_languages_map()
 
     # Filter pairs to only include installed languages
     valid_pairs = {(src, tgt) for src, tgt in available_language_pairs 
@@ -518,15 +756,198 @@ def show_language_pairs(available_language_pairs: Set[Tuple[str, str]]) -> None:
         targets_str = ', '.join(targets)
         print(f"  {source} → ({targets_str})")
 
-def main() -> None:
-    """Main function."""
-    available_language_pairs = detect_available_languages()  # Get all available pairs
-    
-    # Show only installed languages pairs on main usage.
-    installed_languages = get_installed_languages()
-    installed_codes = {lang.code for lang in installed_languages}
-    available_language_pairs = {(il, ol) for il, ol in available_language_pairs if il in installed_codes and ol in installed_codes}
-    
+def translate_batch(translation: Any, lines: List[str]) -> List[str]:
+    """
+    Translate independent lines, returning one output line per input line.
+    Uses the translation's own batch API when it provides one, otherwise the
+    per-line calls are overlapped on a thread pool (CTranslate2 releases the
+    GIL while it translates).
+    """
+    if len(lines) == 1:
+        return [translation.translate(lines[0])]
+
+    if hasattr(translation, "translate_batch"):
+        return list(translation.translate_batch(lines))
+
+    # The first call loads the model lazily and without a lock, so make it
+    # on its own before the remaining lines run concurrently
+    results = [translation.translate(lines[0])]
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(MAX_TRANSLATE_THREADS, len(lines) - 1)) as executor:
+        results.extend(executor.map(translation.translate, lines[1:]))
+    return results
+
+def read_stdin_text() -> str:
+    """
+    Read the text to translate from stdin.
+    Piped input is consumed in full; on a terminal a single line is read,
+    so the user does not have to finish the input with Ctrl+D.
+    """
+    if not sys.stdin.isatty():
+        # Decode the whole input at once instead of through the incremental text layer
+        data = sys.stdin.buffer.read()
+        return data.decode(sys.stdin.encoding or 'utf-8', errors='replace').strip()
+    # Prompt on stderr so that redirected stdout holds only the translation
+    sys.stderr.write("> ")
+    sys.stderr.flush()
+    # readline() returns "" at EOF
+    return sys.stdin.readline().strip()
+
+def _recv_all(conn: Any, timeout: Optional[float] = None, max_size: Optional[int] = None) -> bytes:
+    """
+    Read from a socket until the peer closes its side.
+    timeout bounds the whole read, not each recv(), and max_size caps the
+    number of bytes accepted; exceeding either raises an error.
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    chunks = []
+    received = 0
+    while True:
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError("Timed out waiting for the request")
+            conn.settimeout(remaining)
+        data = conn.recv(DAEMON_RECV_SIZE)
+        if not data:
+            break
+        received += len(data)
+        if max_size is not None and received > max_size:
+            raise ValueError(f"Request larger than {max_size} bytes")
+        chunks.append(data)
+    return b"".join(chunks)
+
+def _acquire_daemon_lock(lock_path: str) -> bool:
+    """
+    Create the daemon lock file holding our PID.
+    A lock left behind by a daemon that no longer runs is replaced.
+    Returns False if another live daemon holds the lock.
+    """
+    for _ in range(2):
+        try:
+            lock_fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                with open(lock_path, 'r') as f:
+                    pid = int(f.read().strip())
+                os.kill(pid, 0)
+                return False
+            except PermissionError:
+                # Process exists but belongs to someone else
+                return False
+            except (OSError, ValueError):
+                # Dead PID or unreadable lock file, treat the lock as stale
+                try:
+                    os.remove(lock_path)
+                except FileNotFoundError:
+                    pass
+                continue
+        os.write(lock_fd, str(os.getpid()).encode())
+        os.close(lock_fd)
+        return True
+    return False
+
+def run_daemon(socket_path: str, verbose: bool = False) -> None:
+    """
+    Serve translation requests over a Unix domain socket.
+
+    Models stay loaded between requests, so only the first request for a
+    language pair pays for loading it. Each request is a JSON object
+    {"il": ..., "ol": ..., "text": ...}; the reply is {"text": ...} or
+    {"error": ...}.
+    """
+    import json
+    import signal
+    import socket
+    import stat
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("[ERROR] Daemon mode requires Unix domain socket support.", file=sys.stderr)
+        sys.exit(1)
+
+    # Only a leftover socket may be replaced, never a regular file or directory
+    try:
+        if not stat.S_ISSOCK(os.lstat(socket_path).st_mode):
+            print(f"[ERROR] '{socket_path}' exists and is not a socket.", file=sys.stderr)
+            sys.exit(1)
+    except FileNotFoundError:
+        pass
+
+    # Lock file prevents a second daemon from taking over the same socket
+    lock_path = socket_path + ".lock"
+    if not _acquire_daemon_lock(lock_path):
+        print(f"[ERROR] Daemon already running (lock file '{lock_path}').", file=sys.stderr)
+        sys.exit(1)
+
+    # Turn SIGTERM into a normal exit so the socket and lock file get cleaned up
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    bound = False
+    try:
+        try:
+            os.remove(socket_path)  # Stale socket of a daemon that is no longer running
+        except FileNotFoundError:
+            pass
+        server.bind(socket_path)
+        bound = True
+        server.listen()
+        verbose_log(f"[INFO] Daemon listening on '{socket_path}'", verbose)
+
+        # Requests are served one at a time; the deadline and size cap keep a
+        # stalled or misbehaving client from blocking everyone else
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    data = _recv_all(conn, timeout=DAEMON_REQUEST_TIMEOUT, max_size=DAEMON_MAX_REQUEST_SIZE)
+                    request = json.loads(data.decode("utf-8"))
+                    verbose_log(f"[INFO] Request: {request['il']} → {request['ol']}", verbose)
+                    translation = find_translation(request["il"], request["ol"])
+                    response = {"text": translation.translate(request["text"])}
+                except TranslatorError as e:
+                    response = {"error": str(e)}
+                except Exception as e:
+                    response = {"error": f"Translation failed: {e}"}
+                try:
+                    conn.settimeout(DAEMON_REQUEST_TIMEOUT)
+                    conn.sendall(json.dumps(response).encode("utf-8"))
+                except OSError as e:
+                    verbose_log(f"[WARNING] Could not send reply: {e}", verbose)
+    except KeyboardInterrupt:
+        verbose_log("[INFO] Daemon stopped.", verbose)
+    finally:
+        server.close()
+        # Only remove the socket this process bound, the lock is ours either way
+        for path in ((socket_path, lock_path) if bound else (lock_path,)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+def run_client(socket_path: str, input_lang: str, output_lang: str, text: str) -> str:
+    """Send a translation request to a running daemon and return the translated text."""
+    import json
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(socket_path)
+        client.sendall(json.dumps({"il": input_lang, "ol": output_lang, "text": text}).encode("utf-8"))
+        client.shutdown(socket.SHUT_WR)
+        response = json.loads(_recv_all(client).decode("utf-8"))
+
+    if "error" in response:
+        raise TranslatorError(response["error"])
+    return response["text"]
+
+@lru_cache(maxsize=1)
+def _build_parser():
+    """Build the command line parser once and reuse it."""
+    # Deferred import, the plain translate fast path in main() never needs argparse
+    import argparse
+
+    # Keep the defaults in sync with _fast_translate_args()
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument('-il', type=str, help="Input language code")
     parser.add_argument('-ol', type=str, help="Output language code")
@@ -536,24 +957,90 @@ def main() -> None:
     parser.add_argument('-c', action='store_true', help="Clean model cache")
     parser.add_argument('-l', action='store_true', help="List available languages and exit")
     parser.add_argument('-p', action='store_true', help="Show available pairs of languages and exit")
+    parser.add_argument('-d', type=str, metavar='SOCKET', help="Run as a daemon serving translations on a Unix socket")
+    parser.add_argument('-dc', type=str, metavar='SOCKET', help="Translate through a running daemon")
     parser.add_argument('text', nargs=argparse.REMAINDER, help="Text to translate")
+    return parser
+
+def _fast_translate_args(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Recognize the plain 'uot.py -il X -ol Y [text...]' form without argparse.
+    Returns None for anything else, including text starting with an option.
+    """
+    if len(argv) < 4 or argv[0] != '-il' or argv[2] != '-ol':
+        return None
+    if len(argv) > 4 and argv[4].startswith('-'):
+        return None
+    return SimpleNamespace(il=argv[1], ol=argv[3], i=False, v=False, im=False, c=False,
+                           l=False, p=False, d=None, dc=None, text=argv[4:])
+
+def main() -> None:
+    """Main function."""
+    # Fast paths for the common 'uot.py -v' and 'uot.py -h', skip building the parser entirely
+    if sys.argv[1:] == ['-v']:
+        print_version()
+        sys.exit(0)
+    if sys.argv[1:] in (['-h'], ['--help']):
+        print_help(detect_available_languages() if os.path.isdir(MODELS_DIR) else set(), installed_only=False)
+        sys.exit(0)
 
     try:
-        args = parser.parse_args()
+        args = _fast_translate_args(sys.argv[1:])
+        unknown_args = []
+        if args is None:
+            args, unknown_args = _build_parser().parse_known_args()
         verbose = args.i
     except Exception as e:
         print(f"[ERROR] Argument parsing failed: {e}", file=sys.stderr)
-        print_help(available_language_pairs)
+        print_help(detect_available_languages() if os.path.isdir(MODELS_DIR) else set(), installed_only=False)
+        sys.exit(1)
+
+    if unknown_args:
+        print(f"[ERROR] Unrecognized arguments: {' '.join(unknown_args)}", file=sys.stderr)
+        print_help(detect_available_languages() if os.path.isdir(MODELS_DIR) else set(), installed_only=False)
         sys.exit(1)
-    
-    if len(sys.argv) == 1:
-        print_help(available_language_pairs)
-        sys.exit(0)
 
+    # Same interned strings as the detected pairs and installed language map
+    if args.il:
+        args.il = sys.intern(args.il)
+    if args.ol:
+        args.ol = sys.intern(args.ol)
+
+    # Handled before touching the models so it never pays for the argostranslate import
     if args.v:
         print_version()
         sys.exit(0)
 
+    # Client mode only talks to the daemon, which already has the models loaded
+    if args.dc:
+        if not args.il or not args.ol:
+            print("[ERROR] Both -il and -ol are required in client mode.", file=sys.stderr)
+            sys.exit(1)
+        input_text = " ".join(args.text).strip() or read_stdin_text()
+        if not input_text:
+            print("[ERROR] No input provided.", file=sys.stderr)
+            sys.exit(1)
+        try:
+            print(run_client(args.dc, args.il, args.ol, input_text))
+        except TranslatorError as e:
+            print(f"[ERROR] {e}", file=sys.stderr)
+            sys.exit(1)
+        except OSError as e:
+            print(f"[ERROR] Could not reach daemon at '{args.dc}': {e}", file=sys.stderr)
+            sys.exit(1)
+        sys.exit(0)
+
+    if len(sys.argv) == 1:
+        # Plain "uot.py" only shows help with whatever is installed right now,
+        # it never installs models or fails on an empty models directory
+        help_pairs: Set[Tuple[str, str]] = set()
+        if os.path.isdir(MODELS_DIR) and get_installed_languages():
+            help_pairs = filter_installed_pairs(detect_available_languages())
+        print_help(help_pairs)
+        sys.exit(0)
+
+    # -c and -im run before the local auto-install so that -im can bootstrap
+    # a fresh checkout without a (populated) models directory
     if args.c:
         clean_model_cache(verbose)
         sys.exit(0)
@@ -562,18 +1049,27 @@ def main() -> None:
         install_models_from_index(verbose)
         sys.exit(0)
 
+    if not get_installed_languages():
+        verbose_log("[INFO] No installed languages found. Installing local models...", verbose)
+        install_models_from_local_dir(verbose)
+
+    available_language_pairs = detect_available_languages()  # Get all available pairs
+    
+    # Show only installed languages pairs on main usage.
+    available_language_pairs = filter_installed_pairs(available_language_pairs)
+
     if args.l:
         list_languages(available_language_pairs, verbose)
         sys.exit(0)
 
     if args.p:
-        # Ensure models are installed before showing pairs
-        if not get_installed_languages():
-            verbose_log("[INFO] No installed languages found. Installing local models...", verbose)
-            install_models_from_local_dir(verbose)
         show_language_pairs(available_language_pairs)
         sys.exit(0)
 
+    if args.d:
+        run_daemon(args.d, verbose)
+        sys.exit(0)
+
     if not args.il or not args.ol:
         print_help(available_language_pairs)
         sys.exit(1)
@@ -582,44 +1078,48 @@ def main() -> None:
         print(f"[TIP] You may need to run 'uot.py -im' to download and install language models.", file=sys.stderr)
         sys.exit(1)
 
-    if not args.text:
-        verbose_log("[INFO] Waiting for input from stdin... (Ctrl+D to end)", verbose)
-        args.text = [sys.stdin.read().strip()]
-        if not args.text[0]:
+    if args.text:
+        input_lines = [" ".join(args.text).strip()]
+    else:
+        # Each non-empty stdin line is translated on its own and printed on its own line
+        verbose_log("[INFO] Waiting for input from stdin...", verbose)
+        input_lines = [line for line in read_stdin_text().splitlines() if line.strip()]
+        if not input_lines:
             print("[ERROR] No input provided.", file=sys.stderr)
             print_help(available_language_pairs)
             sys.exit(1)
 
-    input_text = " ".join(args.text).strip()
-
-    if not get_installed_languages():
-        verbose_log("[INFO] No installed languages found. Installing local models...", verbose)
-        install_models_from_local_dir(verbose)
+    input_text = "\n".join(input_lines)
 
+    # Everything logged up to the translation itself goes out as one write
+    start_verbose_batch()
     try:
         verbose_log(f"[INFO] Looking for translation path: {args.il} → {args.ol}", verbose)
         translation = find_translation(args.il, args.ol)
 
         verbose_log(f"[INFO] Translating: '{input_text}'", verbose)
+        flush_verbose_log()
         start_time = time.perf_counter()
 
-        output_text = translation.translate(input_text)
+        output_text = "\n".join(translate_batch(translation, input_lines))
 
         elapsed_time = time.perf_counter() - start_time
-        memory_usage_mb = measure_memory_usage_mb()
 
         print(output_text)
-        verbose_log(f"[INFO] Translation took {elapsed_time:.2f} seconds, uses {memory_usage_mb} MB RAM", verbose)
+        if verbose:
+            # Only measured when it is shown, psutil is not needed otherwise
+            memory_usage_mb = measure_memory_usage_mb()
+            verbose_log(f"[INFO] Translation took {elapsed_time:.2f} seconds, uses {memory_usage_mb} MB RAM", verbose)
 
     except TranslatorError as e:
+        flush_verbose_log()
         print(f"[ERROR] {e}", file=sys.stderr)
-        available_languages = detect_available_languages()
-        installed_languages = get_installed_languages()
-        installed_codes = [lang.code for lang in installed_languages]
+        installed_codes = get_installed_languages_map()
         if (args.il in installed_codes) and (args.ol in installed_codes):
             print(f"[TIP] You may need to run 'uot.py -im' to download a specific model for {args.il}-{args.ol}.", file=sys.stderr)
         sys.exit(1)
     except Exception as e:
+        flush_verbose_log()
         print(f"[ERROR] Translation failed: {e}", file=sys.stderr)
         sys.exit(1)
 